@@ -4,18 +4,99 @@
 # APPLICATION SETTINGS
 # =============================================================================
 
-# Server configuration
-SERVER_CONFIG = {
-    'host': '0.0.0.0',
-    'port': 8050,
-    'debug': True,  # Set to False for production
+import os
+import pathlib
+from dataclasses import dataclass
+
+try:
+    import yaml
+except ImportError:  # PyYAML is optional; without it only env overrides apply
+    yaml = None
+
+# Deploy-time knobs no longer require editing this file: defaults below are
+# layered with an optional YAML file (sections keyed like the *_CONFIG names)
+# and, last, environment variables. That lets one image serve several
+# environments and lets production set debug=False without a code change.
+CONFIG_ENV_MAP = {
+    'DASH_HOST': ('server', 'host', str),
+    'DASH_PORT': ('server', 'port', int),
+    'DASH_DEBUG': ('server', 'debug',
+                   lambda v: v.lower() in ('1', 'true', 'yes')),
 }
 
+
+def _load_overrides():
+    """Read the optional override file plus environment variables."""
+    overrides = {}
+    path = pathlib.Path(os.environ.get('DASHBOARD_CONFIG',
+                                       'dashboard_config.yml'))
+    if yaml is not None and path.exists():
+        overrides = yaml.safe_load(path.read_text()) or {}
+    for env_name, (section, key, coerce) in CONFIG_ENV_MAP.items():
+        if env_name in os.environ:
+            overrides.setdefault(section, {})[key] = coerce(os.environ[env_name])
+    return overrides
+
+
+_OVERRIDES = _load_overrides()
+
+
+@dataclass(frozen=True, slots=True)
+class _FrozenConfig:
+    """Base class for the immutable config sections below.
+
+    Frozen + slotted instances give attribute access at descriptor speed and
+    make typos fail at import time; `__getitem__`/`get` keep the historical
+    dict-style access working for existing callers.
+    """
+
+    def __getitem__(self, key):
+        return getattr(self, key)
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+# Server configuration
+@dataclass(frozen=True, slots=True)
+class ServerConfig(_FrozenConfig):
+    host: str = '0.0.0.0'
+    port: int = 8050
+    debug: bool = True  # Set to False for production
+
+
+SERVER_CONFIG = ServerConfig(**_OVERRIDES.get('server', {}))
+
 # Cache settings
 CACHE_CONFIG = {
     'countries_cache_hours': 24,  # Hours to cache countries list
     'data_cache_minutes': 30,     # Minutes to cache API responses
 }
+CACHE_CONFIG.update(_OVERRIDES.get('cache', {}))
+
+# Tiered cache TTLs keyed by how often an indicator value can actually
+# change: World Bank series are annual, so observations more than two years
+# old are effectively immutable, while a handful of monetary series get
+# revised often enough to deserve the short flat TTL that used to apply to
+# everything.
+INDICATOR_TTL_SECONDS = {
+    'historical': 30 * 24 * 3600,  # years < current_year - 2
+    'recent':     6 * 3600,        # current_year - 2 .. current_year
+    'volatile':   1800,            # exchange rate, interest rate, inflation
+}
+
+VOLATILE_INDICATOR_CODES = frozenset({
+    'PA.NUS.FCRF', 'FR.INR.RINR', 'FP.CPI.TOTL.ZG',
+})
+
+
+def ttl_for(code, year, current_year):
+    """Return the cache TTL in seconds for one (indicator, year) observation."""
+    if code in VOLATILE_INDICATOR_CODES:
+        return INDICATOR_TTL_SECONDS['volatile']
+    if year >= current_year - 2:
+        return INDICATOR_TTL_SECONDS['recent']
+    return INDICATOR_TTL_SECONDS['historical']
 
 # =============================================================================
 # WORLD BANK API SETTINGS
@@ -29,185 +110,194 @@ API_CONFIG = {
     'per_page': 1000,        # Records per API call
     'max_retries': 3,        # Number of retry attempts
 }
+API_CONFIG.update(_OVERRIDES.get('api', {}))
 
 # Default data range
-DEFAULT_YEARS = {
-    'min_year': 2000,
-    'max_year': 2023,
-    'default_start': 2015,
-    'default_end': 2023,
-}
+@dataclass(frozen=True, slots=True)
+class DefaultYears(_FrozenConfig):
+    min_year: int = 2000
+    max_year: int = 2023
+    default_start: int = 2015
+    default_end: int = 2023
+
+
+DEFAULT_YEARS = DefaultYears()
 
 # =============================================================================
 # ENHANCED ECONOMIC INDICATORS BY CATEGORY
 # =============================================================================
 
-# Comprehensive World Bank indicators organized by categories
-ECONOMIC_INDICATORS = {
-    # GDP and Growth Indicators
-    'GDP (Current US$)': 'NY.GDP.MKTP.CD',
-    'GDP Growth (Annual %)': 'NY.GDP.MKTP.KD.ZG', 
-    'GDP Per Capita': 'NY.GDP.PCAP.CD',
-    'GDP Per Capita Growth': 'NY.GDP.PCAP.KD.ZG',
-    'GNI Per Capita': 'NY.GNP.PCAP.CD',
-    'GNI Atlas Method': 'NY.GNP.PCAP.CD',
-    'GDP Deflator': 'NY.GDP.DEFL.ZS',
-    'Gross Capital Formation': 'NE.GDI.TOTL.ZS',
-    'Final Consumption Expenditure': 'NE.CON.TOTL.ZS',
-    
-    # Inflation and Monetary Policy
-    'Inflation Rate (Consumer Prices)': 'FP.CPI.TOTL.ZG',
-    'Food Inflation': 'FP.CPI.FOOD.ZG',
-    'Core Inflation': 'FP.CPI.TOTL.ZG',
-    'Money Supply Growth': 'FM.LBL.BMNY.ZG',
-    'Interest Rate': 'FR.INR.RINR',
-    'Real Interest Rate': 'FR.INR.RINR',
-    'Exchange Rate': 'PA.NUS.FCRF',
-    'Official Exchange Rate': 'PA.NUS.FCRF',
-    
-    # Labor Market and Employment
-    'Unemployment Rate': 'SL.UEM.TOTL.ZS',
-    'Youth Unemployment': 'SL.UEM.1524.ZS',
-    'Female Unemployment': 'SL.UEM.TOTL.FE.ZS',
-    'Male Unemployment': 'SL.UEM.TOTL.MA.ZS',
-    'Labor Force Participation': 'SL.TLF.CACT.ZS',
-    'Employment in Services (%)': 'SL.SRV.EMPL.ZS',
-    'Employment in Industry (%)': 'SL.IND.EMPL.ZS',
-    'Employment in Agriculture (%)': 'SL.AGR.EMPL.ZS',
-    'Labor Productivity': 'SL.GDP.PCAP.EM.KD',
-    
-    # Demographics and Population
-    'Population': 'SP.POP.TOTL',
-    'Population Growth': 'SP.POP.GROW',
-    'Urban Population (%)': 'SP.URB.TOTL.IN.ZS',
-    'Rural Population (%)': 'SP.RUR.TOTL.ZS',
-    'Population Density': 'EN.POP.DNST',
-    'Life Expectancy': 'SP.DYN.LE00.IN',
-    'Female Life Expectancy': 'SP.DYN.LE00.FE.IN',
-    'Male Life Expectancy': 'SP.DYN.LE00.MA.IN',
-    'Fertility Rate': 'SP.DYN.TFRT.IN',
-    'Birth Rate': 'SP.DYN.CBRT.IN',
-    'Death Rate': 'SP.DYN.CDRT.IN',
-    'Infant Mortality Rate': 'SP.DYN.IMRT.IN',
-    'Child Mortality Rate (Under 5)': 'SH.DYN.MORT',
-    'Age Dependency Ratio': 'SP.POP.DPND',
-    
-    # International Trade
-    'Exports of Goods and Services': 'NE.EXP.GNFS.CD',
-    'Imports of Goods and Services': 'NE.IMP.GNFS.CD',
-    'Trade Balance': 'NE.RSB.GNFS.CD',
-    'Trade (% of GDP)': 'NE.TRD.GNFS.ZS',
-    'Current Account Balance': 'BN.CAB.XOKA.CD',
-    'Current Account Balance (% GDP)': 'BN.CAB.XOKA.GD.ZS',
-    'Merchandise Trade (% GDP)': 'TG.VAL.TOTL.GD.ZS',
-    'Services Trade (% GDP)': 'BG.GSR.NFSV.GD.ZS',
-    'Export Value Index': 'TX.QTY.MRCH.XD.WD',
-    'Import Value Index': 'TM.QTY.MRCH.XD.WD',
-    'Terms of Trade': 'TT.PRI.MRCH.XD.WD',
-    
-    # Foreign Investment and Capital Flows
-    'Foreign Direct Investment': 'BX.KLT.DINV.CD.WD',
-    'FDI Inflows (% GDP)': 'BX.KLT.DINV.WD.GD.ZS',
-    'FDI Outflows': 'BM.KLT.DINV.CD.WD',
-    'Portfolio Investment': 'BX.PEF.TOTL.CD.WD',
-    'External Debt': 'DT.DOD.DECT.CD',
-    'Total Reserves': 'FI.RES.TOTL.CD',
-    'Reserves (Months of Imports)': 'FI.RES.TOTL.MO',
-    
-    # Government Finance
-    'Government Debt (% of GDP)': 'GC.DOD.TOTL.GD.ZS',
-    'Government Expenditure (% of GDP)': 'GC.XPN.TOTL.GD.ZS',
-    'Government Revenue (% GDP)': 'GC.REV.TOTL.GD.ZS',
-    'Tax Revenue (% of GDP)': 'GC.TAX.TOTL.GD.ZS',
-    'Budget Balance (% GDP)': 'GC.BAL.TOTL.GD.ZS',
-    'Military Expenditure (% of GDP)': 'MS.MIL.XPND.GD.ZS',
-    'Public Debt Service': 'GC.DOD.TOTL.GD.ZS',
-    
-    # Infrastructure and Technology
-    'Internet Users (%)': 'IT.NET.USER.ZS',
-    'Mobile Subscriptions': 'IT.CEL.SETS.P2',
-    'Fixed Broadband Subscriptions': 'IT.NET.BBND.P2',
-    'Telephone Lines': 'IT.MLT.MAIN.P2',
-    'Electric Power Consumption': 'EG.USE.ELEC.KH.PC',
-    'Electricity Production': 'EG.ELC.PROD.KH',
-    'Energy Use Per Capita': 'EG.USE.PCAP.KG.OE',
-    'Railway Lines (km)': 'IS.RRS.TOTL.KM',
-    'Road Density': 'IS.ROD.DNST.K2',
-    'Air Transport Passengers': 'IS.AIR.PSGR',
-    'Container Port Traffic': 'IS.SHP.GOOD.TU',
-    
-    # Environment and Energy
-    'CO2 Emissions (kt)': 'EN.ATM.CO2E.KT',
-    'CO2 Emissions Per Capita': 'EN.ATM.CO2E.PC',
-    'Methane Emissions': 'EN.ATM.METH.KT.CE',
-    'Nitrous Oxide Emissions': 'EN.ATM.NOXE.KT.CE',
-    'Renewable Energy (%)': 'EG.FEC.RNEW.ZS',
-    'Fossil Fuel Consumption': 'EG.USE.COMM.FO.ZS',
-    'Forest Area (%)': 'AG.LND.FRST.ZS',
-    'Agricultural Land (%)': 'AG.LND.AGRI.ZS',
-    'Arable Land (%)': 'AG.LND.ARBL.ZS',
-    'Water Resources': 'ER.H2O.INTR.PC',
-    'PM2.5 Air Pollution': 'EN.ATM.PM25.MC.M3',
-    
-    # Education
-    'Education Expenditure (% of GDP)': 'SE.XPD.TOTL.GD.ZS',
-    'Primary Education Completion': 'SE.PRM.CMPT.ZS',
-    'Secondary Education Enrollment': 'SE.SEC.NENR',
-    'Tertiary Education Enrollment': 'SE.TER.ENRR',
-    'Adult Literacy Rate': 'SE.ADT.LITR.ZS',
-    'Youth Literacy Rate': 'SE.ADT.1524.LT.ZS',
-    'Female Literacy Rate': 'SE.ADT.LITR.FE.ZS',
-    'School Life Expectancy': 'SE.SCH.LIFE',
-    'Primary School Enrollment': 'SE.PRM.NENR',
-    'Pupil-Teacher Ratio': 'SE.PRM.ENRL.TC.ZS',
-    
-    # Health
-    'Health Expenditure (% of GDP)': 'SH.XPD.CHEX.GD.ZS',
-    'Health Expenditure Per Capita': 'SH.XPD.CHEX.PC.CD',
-    'Hospital Beds (per 1000)': 'SH.MED.BEDS.ZS',
-    'Physicians (per 1000)': 'SH.MED.PHYS.ZS',
-    'Nurses and Midwives (per 1000)': 'SH.MED.NUMW.P3',
-    'Immunization Rate (DPT)': 'SH.IMM.IDPT',
-    'Immunization Rate (Measles)': 'SH.IMM.MEAS',
-    'Maternal Mortality Rate': 'SH.STA.MMRT',
-    'Malnutrition Prevalence': 'SH.STA.MALN.ZS',
-    'HIV Prevalence': 'SH.DYN.AIDS.ZS',
-    'Tuberculosis Incidence': 'SH.TBS.INCD',
-    
-    # Agriculture and Food Security
-    'Food Production Index': 'AG.PRD.FOOD.XD',
-    'Crop Production Index': 'AG.PRD.CROP.XD',
-    'Livestock Production Index': 'AG.PRD.LVSK.XD',
-    'Fertilizer Consumption': 'AG.CON.FERT.ZS',
-    'Cereal Yield': 'AG.YLD.CREL.KG',
-    'Agricultural Value Added': 'NV.AGR.TOTL.ZS',
-    'Rural Population': 'SP.RUR.TOTL.ZS',
-    'Permanent Cropland': 'AG.LND.CROP.ZS',
-    
-    # Innovation and Research
-    'R&D Expenditure (% of GDP)': 'GB.XPD.RSDV.GD.ZS',
-    'Researchers (per million)': 'SP.POP.SCIE.RD.P6',
-    'Patent Applications': 'IP.PAT.RESD',
-    'Trademark Applications': 'IP.TMK.RESD',
-    'High-tech Exports (%)': 'TX.VAL.TECH.CD',
-    'Scientific Publications': 'IP.JRN.ARTC.SC',
-    
-    # Social Protection and Poverty
-    'Poverty Headcount ($1.90)': 'SI.POV.DDAY',
-    'Poverty Headcount ($3.20)': 'SI.POV.LMIC',
-    'Poverty Headcount ($5.50)': 'SI.POV.UMIC',
-    'GINI Index': 'SI.POV.GINI',
-    'Income Share - Bottom 10%': 'SI.DST.FRST.10',
-    'Income Share - Top 10%': 'SI.DST.10TH.10',
-    'Social Protection Coverage': 'per_si_allsi.cov_pop_tot',
+# Comprehensive World Bank indicators organized by categories.
+# The nested layout is the source of truth; the flat ECONOMIC_INDICATORS
+# dict and the indicator->category reverse index are derived from it once
+# at import, so category lookups never have to re-scan this table.
+INDICATOR_CATEGORIES = {
+    'GDP and Growth Indicators': {
+        'GDP (Current US$)': 'NY.GDP.MKTP.CD',
+        'GDP Growth (Annual %)': 'NY.GDP.MKTP.KD.ZG',
+        'GDP Per Capita': 'NY.GDP.PCAP.CD',
+        'GDP Per Capita Growth': 'NY.GDP.PCAP.KD.ZG',
+        'GNI Per Capita': 'NY.GNP.PCAP.CD',
+        'GNI Atlas Method': 'NY.GNP.PCAP.CD',
+        'GDP Deflator': 'NY.GDP.DEFL.ZS',
+        'Gross Capital Formation': 'NE.GDI.TOTL.ZS',
+        'Final Consumption Expenditure': 'NE.CON.TOTL.ZS',
+    },
+    'Inflation and Monetary Policy': {
+        'Inflation Rate (Consumer Prices)': 'FP.CPI.TOTL.ZG',
+        'Food Inflation': 'FP.CPI.FOOD.ZG',
+        'Core Inflation': 'FP.CPI.TOTL.ZG',
+        'Money Supply Growth': 'FM.LBL.BMNY.ZG',
+        'Interest Rate': 'FR.INR.RINR',
+        'Real Interest Rate': 'FR.INR.RINR',
+        'Exchange Rate': 'PA.NUS.FCRF',
+        'Official Exchange Rate': 'PA.NUS.FCRF',
+    },
+    'Labor Market and Employment': {
+        'Unemployment Rate': 'SL.UEM.TOTL.ZS',
+        'Youth Unemployment': 'SL.UEM.1524.ZS',
+        'Female Unemployment': 'SL.UEM.TOTL.FE.ZS',
+        'Male Unemployment': 'SL.UEM.TOTL.MA.ZS',
+        'Labor Force Participation': 'SL.TLF.CACT.ZS',
+        'Employment in Services (%)': 'SL.SRV.EMPL.ZS',
+        'Employment in Industry (%)': 'SL.IND.EMPL.ZS',
+        'Employment in Agriculture (%)': 'SL.AGR.EMPL.ZS',
+        'Labor Productivity': 'SL.GDP.PCAP.EM.KD',
+    },
+    'Demographics and Population': {
+        'Population': 'SP.POP.TOTL',
+        'Population Growth': 'SP.POP.GROW',
+        'Urban Population (%)': 'SP.URB.TOTL.IN.ZS',
+        'Rural Population (%)': 'SP.RUR.TOTL.ZS',
+        'Population Density': 'EN.POP.DNST',
+        'Life Expectancy': 'SP.DYN.LE00.IN',
+        'Female Life Expectancy': 'SP.DYN.LE00.FE.IN',
+        'Male Life Expectancy': 'SP.DYN.LE00.MA.IN',
+        'Fertility Rate': 'SP.DYN.TFRT.IN',
+        'Birth Rate': 'SP.DYN.CBRT.IN',
+        'Death Rate': 'SP.DYN.CDRT.IN',
+        'Infant Mortality Rate': 'SP.DYN.IMRT.IN',
+        'Child Mortality Rate (Under 5)': 'SH.DYN.MORT',
+        'Age Dependency Ratio': 'SP.POP.DPND',
+    },
+    'International Trade': {
+        'Exports of Goods and Services': 'NE.EXP.GNFS.CD',
+        'Imports of Goods and Services': 'NE.IMP.GNFS.CD',
+        'Trade Balance': 'NE.RSB.GNFS.CD',
+        'Trade (% of GDP)': 'NE.TRD.GNFS.ZS',
+        'Current Account Balance': 'BN.CAB.XOKA.CD',
+        'Current Account Balance (% GDP)': 'BN.CAB.XOKA.GD.ZS',
+        'Merchandise Trade (% GDP)': 'TG.VAL.TOTL.GD.ZS',
+        'Services Trade (% GDP)': 'BG.GSR.NFSV.GD.ZS',
+        'Export Value Index': 'TX.QTY.MRCH.XD.WD',
+        'Import Value Index': 'TM.QTY.MRCH.XD.WD',
+        'Terms of Trade': 'TT.PRI.MRCH.XD.WD',
+    },
+    'Foreign Investment and Capital Flows': {
+        'Foreign Direct Investment': 'BX.KLT.DINV.CD.WD',
+        'FDI Inflows (% GDP)': 'BX.KLT.DINV.WD.GD.ZS',
+        'FDI Outflows': 'BM.KLT.DINV.CD.WD',
+        'Portfolio Investment': 'BX.PEF.TOTL.CD.WD',
+        'External Debt': 'DT.DOD.DECT.CD',
+        'Total Reserves': 'FI.RES.TOTL.CD',
+        'Reserves (Months of Imports)': 'FI.RES.TOTL.MO',
+    },
+    'Government Finance': {
+        'Government Debt (% of GDP)': 'GC.DOD.TOTL.GD.ZS',
+        'Government Expenditure (% of GDP)': 'GC.XPN.TOTL.GD.ZS',
+        'Government Revenue (% GDP)': 'GC.REV.TOTL.GD.ZS',
+        'Tax Revenue (% of GDP)': 'GC.TAX.TOTL.GD.ZS',
+        'Budget Balance (% GDP)': 'GC.BAL.TOTL.GD.ZS',
+        'Military Expenditure (% of GDP)': 'MS.MIL.XPND.GD.ZS',
+        'Public Debt Service': 'GC.DOD.TOTL.GD.ZS',
+    },
+    'Infrastructure and Technology': {
+        'Internet Users (%)': 'IT.NET.USER.ZS',
+        'Mobile Subscriptions': 'IT.CEL.SETS.P2',
+        'Fixed Broadband Subscriptions': 'IT.NET.BBND.P2',
+        'Telephone Lines': 'IT.MLT.MAIN.P2',
+        'Electric Power Consumption': 'EG.USE.ELEC.KH.PC',
+        'Electricity Production': 'EG.ELC.PROD.KH',
+        'Energy Use Per Capita': 'EG.USE.PCAP.KG.OE',
+        'Railway Lines (km)': 'IS.RRS.TOTL.KM',
+        'Road Density': 'IS.ROD.DNST.K2',
+        'Air Transport Passengers': 'IS.AIR.PSGR',
+        'Container Port Traffic': 'IS.SHP.GOOD.TU',
+    },
+    'Environment and Energy': {
+        'CO2 Emissions (kt)': 'EN.ATM.CO2E.KT',
+        'CO2 Emissions Per Capita': 'EN.ATM.CO2E.PC',
+        'Methane Emissions': 'EN.ATM.METH.KT.CE',
+        'Nitrous Oxide Emissions': 'EN.ATM.NOXE.KT.CE',
+        'Renewable Energy (%)': 'EG.FEC.RNEW.ZS',
+        'Fossil Fuel Consumption': 'EG.USE.COMM.FO.ZS',
+        'Forest Area (%)': 'AG.LND.FRST.ZS',
+        'Agricultural Land (%)': 'AG.LND.AGRI.ZS',
+        'Arable Land (%)': 'AG.LND.ARBL.ZS',
+        'Water Resources': 'ER.H2O.INTR.PC',
+        'PM2.5 Air Pollution': 'EN.ATM.PM25.MC.M3',
+    },
+    'Education': {
+        'Education Expenditure (% of GDP)': 'SE.XPD.TOTL.GD.ZS',
+        'Primary Education Completion': 'SE.PRM.CMPT.ZS',
+        'Secondary Education Enrollment': 'SE.SEC.NENR',
+        'Tertiary Education Enrollment': 'SE.TER.ENRR',
+        'Adult Literacy Rate': 'SE.ADT.LITR.ZS',
+        'Youth Literacy Rate': 'SE.ADT.1524.LT.ZS',
+        'Female Literacy Rate': 'SE.ADT.LITR.FE.ZS',
+        'School Life Expectancy': 'SE.SCH.LIFE',
+        'Primary School Enrollment': 'SE.PRM.NENR',
+        'Pupil-Teacher Ratio': 'SE.PRM.ENRL.TC.ZS',
+    },
+    'Health': {
+        'Health Expenditure (% of GDP)': 'SH.XPD.CHEX.GD.ZS',
+        'Health Expenditure Per Capita': 'SH.XPD.CHEX.PC.CD',
+        'Hospital Beds (per 1000)': 'SH.MED.BEDS.ZS',
+        'Physicians (per 1000)': 'SH.MED.PHYS.ZS',
+        'Nurses and Midwives (per 1000)': 'SH.MED.NUMW.P3',
+        'Immunization Rate (DPT)': 'SH.IMM.IDPT',
+        'Immunization Rate (Measles)': 'SH.IMM.MEAS',
+        'Maternal Mortality Rate': 'SH.STA.MMRT',
+        'Malnutrition Prevalence': 'SH.STA.MALN.ZS',
+        'HIV Prevalence': 'SH.DYN.AIDS.ZS',
+        'Tuberculosis Incidence': 'SH.TBS.INCD',
+    },
+    'Agriculture and Food Security': {
+        'Food Production Index': 'AG.PRD.FOOD.XD',
+        'Crop Production Index': 'AG.PRD.CROP.XD',
+        'Livestock Production Index': 'AG.PRD.LVSK.XD',
+        'Fertilizer Consumption': 'AG.CON.FERT.ZS',
+        'Cereal Yield': 'AG.YLD.CREL.KG',
+        'Agricultural Value Added': 'NV.AGR.TOTL.ZS',
+        'Rural Population': 'SP.RUR.TOTL.ZS',
+        'Permanent Cropland': 'AG.LND.CROP.ZS',
+    },
+    'Innovation and Research': {
+        'R&D Expenditure (% of GDP)': 'GB.XPD.RSDV.GD.ZS',
+        'Researchers (per million)': 'SP.POP.SCIE.RD.P6',
+        'Patent Applications': 'IP.PAT.RESD',
+        'Trademark Applications': 'IP.TMK.RESD',
+        'High-tech Exports (%)': 'TX.VAL.TECH.CD',
+        'Scientific Publications': 'IP.JRN.ARTC.SC',
+    },
+    'Social Protection and Poverty': {
+        'Poverty Headcount ($1.90)': 'SI.POV.DDAY',
+        'Poverty Headcount ($3.20)': 'SI.POV.LMIC',
+        'Poverty Headcount ($5.50)': 'SI.POV.UMIC',
+        'GINI Index': 'SI.POV.GINI',
+        'Income Share - Bottom 10%': 'SI.DST.FRST.10',
+        'Income Share - Top 10%': 'SI.DST.10TH.10',
+        'Social Protection Coverage': 'per_si_allsi.cov_pop_tot',
+    },
 }
 
 # =============================================================================
 # ENHANCED COUNTRY GROUPS
 # =============================================================================
 
-# Comprehensive country groups for analysis
-COUNTRY_GROUPS = {
+# Comprehensive country groups for analysis. Raw source table; the public
+# COUNTRY_GROUPS (normalized, with membership sets) is derived lazily below.
+_RAW_COUNTRY_GROUPS = {
     'G7': {
         'name': 'G7 Advanced Economies',
         'countries': ['USA', 'JPN', 'DEU', 'GBR', 'FRA', 'ITA', 'CAN'],
@@ -277,26 +367,252 @@ COUNTRY_GROUPS = {
     }
 }
 
+# =============================================================================
+# DERIVED STRUCTURES
+# =============================================================================
+
+# Everything below is computed from the literals above. Because the result is
+# identical for a given config.py, the finished structures are pickled to
+# .config.cache.pkl keyed by a hash of this file's source: worker processes
+# spawned after the first (gunicorn, autoscaling) skip the rebuild entirely
+# and load the cache in a single pickle.load.
+
+import hashlib as _hashlib
+import os as _os
+import pickle as _pickle
+import sys as _sys
+from collections import defaultdict as _defaultdict
+
+_CONFIG_CACHE_FILE = _os.path.join(_os.path.dirname(_os.path.abspath(__file__)),
+                                   '.config.cache.pkl')
+
+
+def _build_derived():
+    """Build every derived lookup structure from the raw literals above."""
+    # Flat name -> code map kept for existing consumers
+    economic_indicators = {
+        name: code
+        for category in INDICATOR_CATEGORIES.values()
+        for name, code in category.items()
+    }
+
+    # Constant-time category lookup for UI rendering and per-category loading
+    indicator_to_category = {
+        name: cat_name
+        for cat_name, category in INDICATOR_CATEGORIES.items()
+        for name in category
+    }
+
+    # Reverse lookup (code -> display name) so callbacks resolve World Bank
+    # codes in O(1) instead of scanning the indicator dict. Several codes are
+    # aliased under more than one display name, so the first name wins
+    # deterministically.
+    code_to_name = {}
+    for name, code in economic_indicators.items():
+        code_to_name.setdefault(code, name)
+
+    # Some display names are aliases for the same World Bank code (e.g. 'Core
+    # Inflation' and 'Inflation Rate (Consumer Prices)' both resolve to
+    # FP.CPI.TOTL.ZG). The fetch layer should request each code once and fan
+    # the response back out to every alias, instead of issuing duplicate API
+    # calls.
+    code_aliases = _defaultdict(list)
+    for name, code in economic_indicators.items():
+        code_aliases[code].append(name)
+
+    # Normalize the group country lists: a tuple keeps deterministic
+    # iteration order while the parallel frozenset gives O(1) membership
+    # tests ('USA' in group['countries_set']) and guards against accidental
+    # mutation.
+    country_groups = {}
+    for key, group in _RAW_COUNTRY_GROUPS.items():
+        codes = tuple(group['countries'])
+        country_groups[key] = {**group, 'countries': codes,
+                               'countries_set': frozenset(codes)}
+
+    # Reverse index so rendering a country's group badges is O(1) instead of
+    # scanning every group
+    country_to_groups = _defaultdict(list)
+    for key, group in country_groups.items():
+        for code in group['countries']:
+            country_to_groups[code].append(key)
+
+    # Ready-made Dash component inputs, so the layout never rebuilds a
+    # ~130-entry list of option dicts on every render.
+    indicator_dropdown_options = tuple(
+        {'label': name, 'value': name} for name in sorted(economic_indicators)
+    )
+    country_group_dropdown_options = tuple(
+        {'label': group['name'], 'value': key}
+        for key, group in _RAW_COUNTRY_GROUPS.items()
+    )
+    year_marks = {
+        year: {'label': str(year), 'style': {'fontSize': '10px'}}
+        for year in range(DEFAULT_YEARS['min_year'],
+                          DEFAULT_YEARS['max_year'] + 1, 4)
+    }
+
+    # Request URLs are assembled from parts that are all fixed at boot, so
+    # the fetch layer only has to do a single .format() per call. The batched
+    # code strings use the World Bank 'code1;code2' multi-indicator syntax,
+    # deduplicated per category.
+    indicator_url_template = (
+        f"{API_CONFIG['base_url']}/country/{{country}}/indicator/{{code}}"
+        f"?format=json&per_page={API_CONFIG['per_page']}&date={{start}}:{{end}}"
+    )
+    batched_codes_by_category = {
+        cat_name: ';'.join(dict.fromkeys(category.values()))
+        for cat_name, category in INDICATOR_CATEGORIES.items()
+    }
+
+    return {
+        'ECONOMIC_INDICATORS': economic_indicators,
+        'INDICATOR_TO_CATEGORY': indicator_to_category,
+        'INDICATOR_CODE_TO_NAME': code_to_name,
+        # Fast O(1) membership tests (x in dict.values() is O(N))
+        'ALL_INDICATOR_CODES': frozenset(economic_indicators.values()),
+        'INDICATOR_ALIASES': {
+            code: tuple(names)
+            for code, names in code_aliases.items() if len(names) > 1
+        },
+        'CANONICAL_INDICATOR_CODES': tuple(
+            dict.fromkeys(economic_indicators.values())
+        ),
+        'COUNTRY_GROUPS': country_groups,
+        # Every country in at least one group, for fast global filtering
+        'ALL_GROUPED_COUNTRIES': frozenset().union(
+            *(g['countries_set'] for g in country_groups.values())
+        ),
+        'INDICATOR_DROPDOWN_OPTIONS': indicator_dropdown_options,
+        'COUNTRY_GROUP_DROPDOWN_OPTIONS': country_group_dropdown_options,
+        'YEAR_MARKS': year_marks,
+        'INDICATOR_URL_TEMPLATE': indicator_url_template,
+        'BATCHED_INDICATOR_CODES_BY_CATEGORY': batched_codes_by_category,
+        'COUNTRY_TO_GROUPS': {
+            code: tuple(groups) for code, groups in country_to_groups.items()
+        },
+    }
+
+
+def _load_or_build_derived():
+    """Load the derived structures from the pickle cache, rebuilding it
+    whenever this file's source or the active overrides have changed.
+
+    _build_derived reads the post-override API_CONFIG, so the overrides
+    (yml file plus environment) are part of the cache key: changing them
+    must invalidate the pickle just like editing this file does.
+    """
+    source_hash = _hashlib.sha1(
+        open(_os.path.abspath(__file__), 'rb').read()
+        + repr(sorted(_OVERRIDES.items())).encode()).hexdigest()
+
+    try:
+        with open(_CONFIG_CACHE_FILE, 'rb') as f:
+            cached = _pickle.load(f)
+        if cached.get('hash') == source_hash:
+            return cached['data']
+    except (OSError, _pickle.UnpicklingError, EOFError, AttributeError, KeyError):
+        pass
+
+    derived = _build_derived()
+    try:
+        # Atomic write so a concurrently-starting worker never sees a
+        # half-written cache file.
+        tmp_path = _CONFIG_CACHE_FILE + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            _pickle.dump({'hash': source_hash, 'data': derived}, f,
+                         protocol=_pickle.HIGHEST_PROTOCOL)
+        _os.replace(tmp_path, _CONFIG_CACHE_FILE)
+    except OSError:
+        pass
+    return derived
+
+
+# The derived tables are materialized lazily (PEP 562): entrypoints that only
+# need SERVER_CONFIG (health checks, CLI utilities) never pay for building or
+# unpickling the full indicator/country machinery.
+_DERIVED_NAMES = frozenset({
+    'ECONOMIC_INDICATORS', 'INDICATOR_TO_CATEGORY', 'INDICATOR_CODE_TO_NAME',
+    'ALL_INDICATOR_CODES', 'INDICATOR_ALIASES', 'CANONICAL_INDICATOR_CODES',
+    'COUNTRY_GROUPS', 'ALL_GROUPED_COUNTRIES',
+    'INDICATOR_DROPDOWN_OPTIONS', 'COUNTRY_GROUP_DROPDOWN_OPTIONS', 'YEAR_MARKS',
+    'INDICATOR_URL_TEMPLATE', 'BATCHED_INDICATOR_CODES_BY_CATEGORY',
+    'COUNTRY_TO_GROUPS',
+})
+
+
+def _materialize_derived():
+    """Load (or build) the derived structures and install them as module
+    globals, so `__getattr__` only ever fires once."""
+    from types import MappingProxyType
+
+    derived = _load_or_build_derived()
+
+    # Re-intern the code strings (pickle round-trips produce fresh string
+    # objects): every later occurrence in API parsing and DataFrame keys then
+    # shares one object, turning equality checks into pointer compares.
+    derived['ECONOMIC_INDICATORS'] = {
+        n: _sys.intern(c) for n, c in derived['ECONOMIC_INDICATORS'].items()
+    }
+    for group in derived['COUNTRY_GROUPS'].values():
+        group['countries'] = tuple(_sys.intern(c) for c in group['countries'])
+        group['countries_set'] = frozenset(group['countries'])
+
+    # Same read-only treatment as the literal config dicts below
+    derived['ECONOMIC_INDICATORS'] = MappingProxyType(derived['ECONOMIC_INDICATORS'])
+    derived['INDICATOR_TO_CATEGORY'] = MappingProxyType(derived['INDICATOR_TO_CATEGORY'])
+    derived['INDICATOR_CODE_TO_NAME'] = MappingProxyType(derived['INDICATOR_CODE_TO_NAME'])
+    derived['COUNTRY_GROUPS'] = MappingProxyType({
+        key: MappingProxyType(group)
+        for key, group in derived['COUNTRY_GROUPS'].items()
+    })
+
+    globals().update(derived)
+    return derived
+
+
+def __getattr__(name):
+    if name in _DERIVED_NAMES:
+        return _materialize_derived()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # =============================================================================
 # ENHANCED VISUALIZATION SETTINGS
 # =============================================================================
 
 # Chart configuration with modern styling
-CHART_CONFIG = {
-    'default_height': 500,
-    'default_template': 'plotly_white',
-    'color_palette': [
+@dataclass(frozen=True, slots=True)
+class ChartConfig(_FrozenConfig):
+    default_height: int = 500
+    default_template: str = 'plotly_white'
+    color_palette: tuple = (
         '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728', '#9467bd',
         '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf',
         '#aec7e8', '#ffbb78', '#98df8a', '#ff9896', '#c5b0d5'
-    ],
-    'background_color': 'rgba(248,249,250,0.8)',
-    'grid_color': '#e5e5e5',
-    'font_family': 'Arial, sans-serif',
-    'title_font_size': 16,
-    'axis_font_size': 12,
-    'legend_font_size': 10,
-}
+    )
+    background_color: str = 'rgba(248,249,250,0.8)'
+    grid_color: str = '#e5e5e5'
+    font_family: str = 'Arial, sans-serif'
+    title_font_size: int = 16
+    axis_font_size: int = 12
+    legend_font_size: int = 10
+
+
+CHART_CONFIG = ChartConfig()
+
+
+def _hex_to_rgb(h):
+    h = h.lstrip('#')
+    return (int(h[0:2], 16), int(h[2:4], 16), int(h[4:6], 16))
+
+
+# Pre-parsed palette variants so chart code can index a ready-made color
+# (CHART_PALETTE_RGBA_08[i % len(...)]) instead of re-parsing hex strings
+# through Plotly's color utilities on every trace.
+CHART_PALETTE_RGB = tuple(_hex_to_rgb(h) for h in CHART_CONFIG['color_palette'])
+CHART_PALETTE_RGBA_08 = tuple(
+    f'rgba({r},{g},{b},0.8)' for r, g, b in CHART_PALETTE_RGB
+)
 
 # Export settings
 EXPORT_CONFIG = {
@@ -314,129 +630,49 @@ EXPORT_CONFIG = {
 # =============================================================================
 
 # Modern Bootstrap theme and styling
-UI_CONFIG = {
-    'theme': 'BOOTSTRAP',
-    'title': '🌍 Global Economic Dashboard',
-    'subtitle': 'Comprehensive economic analysis with World Bank data',
-    'show_data_table': False,  # Disabled as per requirements
-    'max_table_rows': 100,
-    'enable_exports': True,
-    'enable_data_import': True,
-    'chart_types_per_indicator': True,  # New feature
-    'responsive_design': True,
-    'modern_cards': True,
-}
-
-# Enhanced custom CSS
-CUSTOM_CSS = """
-/* Main header styling */
-.bg-primary {
-    background: linear-gradient(135deg, #667eea 0%, #764ba2 100%) !important;
-}
-
-/* Card hover effects */
-.card {
-    transition: transform 0.2s ease-in-out, box-shadow 0.2s ease-in-out;
-}
-
-.card:hover {
-    transform: translateY(-2px);
-    box-shadow: 0 8px 25px rgba(0,0,0,0.1);
-}
-
-/* Chart type dropdown styling */
-.chart-type-dropdown .Select-control {
-    border: 1px solid #dee2e6;
-    border-radius: 0.375rem;
-}
-
-/* Button enhancements */
-.btn {
-    border-radius: 0.5rem;
-    font-weight: 500;
-    transition: all 0.2s ease-in-out;
-}
-
-.btn:hover {
-    transform: translateY(-1px);
-    box-shadow: 0 4px 12px rgba(0,0,0,0.15);
-}
-
-/* Upload area styling */
-.upload-area {
-    background: linear-gradient(45deg, #f8f9fa, #e9ecef);
-    border: 2px dashed #6c757d;
-    transition: all 0.3s ease;
-}
-
-.upload-area:hover {
-    border-color: #0d6efd;
-    background: linear-gradient(45deg, #e7f3ff, #cce7ff);
-}
-
-/* Responsive adjustments */
-@media (max-width: 768px) {
-    .display-4 {
-        font-size: 2rem;
-    }
-    
-    .btn-group {
-        flex-direction: column;
-    }
-    
-    .btn-group .btn {
-        margin-bottom: 0.5rem;
-    }
-}
-
-/* Loading animation */
-.dash-spinner {
-    border-color: #667eea;
-}
-
-/* Alert styling */
-.alert {
-    border-radius: 0.75rem;
-    border: none;
-    box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-}
-
-/* Card header improvements */
-.card-header {
-    background: linear-gradient(90deg, #f8f9fa, #ffffff);
-    border-bottom: 2px solid #e9ecef;
-    font-weight: 600;
-}
-
-/* Range slider improvements */
-.rc-slider-track {
-    background: linear-gradient(90deg, #667eea, #764ba2);
-}
-
-.rc-slider-handle {
-    border-color: #667eea;
-}
-"""
+@dataclass(frozen=True, slots=True)
+class UiConfig(_FrozenConfig):
+    theme: str = 'BOOTSTRAP'
+    title: str = '🌍 Global Economic Dashboard'
+    subtitle: str = 'Comprehensive economic analysis with World Bank data'
+    show_data_table: bool = False  # Disabled as per requirements
+    max_table_rows: int = 100
+    enable_exports: bool = True
+    enable_data_import: bool = True
+    chart_types_per_indicator: bool = True  # New feature
+    responsive_design: bool = True
+    modern_cards: bool = True
+
+
+UI_CONFIG = UiConfig()
+
+# Custom CSS now lives in assets/ so Dash serves it as a static file with
+# proper caching headers instead of re-emitting an inline Python string on
+# every page load. Edit the asset directly; this path is kept for reference.
+CUSTOM_CSS_PATH = 'assets/custom.min.css'
 
 # =============================================================================
 # ADVANCED FEATURES CONFIGURATION
 # =============================================================================
 
 # Feature flags
-FEATURES = {
-    'enable_caching': True,
-    'enable_data_validation': True,
-    'enable_error_reporting': True,
-    'enable_progress_tracking': True,
-    'enable_data_export': True,
-    'enable_data_import': True,  # New feature
-    'enable_chart_download': True,
-    'individual_chart_types': True,  # New feature
-    'show_data_sources': True,
-    'show_last_updated': True,
-    'responsive_charts': True,
-    'modern_ui': True,
-}
+@dataclass(frozen=True, slots=True)
+class Features(_FrozenConfig):
+    enable_caching: bool = True
+    enable_data_validation: bool = True
+    enable_error_reporting: bool = True
+    enable_progress_tracking: bool = True
+    enable_data_export: bool = True
+    enable_data_import: bool = True  # New feature
+    enable_chart_download: bool = True
+    individual_chart_types: bool = True  # New feature
+    show_data_sources: bool = True
+    show_last_updated: bool = True
+    responsive_charts: bool = True
+    modern_ui: bool = True
+
+
+FEATURES = Features()
 
 # Enhanced data validation rules
 DATA_VALIDATION = {
@@ -454,38 +690,64 @@ DATA_VALIDATION = {
 # =============================================================================
 
 # Enhanced logging configuration
-LOGGING_CONFIG = {
-    'level': 'INFO',
-    'log_file': 'dashboard.log',
-    'max_file_size': '10MB',
-    'backup_count': 5,
-    'log_api_calls': True,
-    'log_user_interactions': True,
-    'log_exports': True,
-    'log_imports': True,
-}
+@dataclass(frozen=True, slots=True)
+class LoggingConfig(_FrozenConfig):
+    level: str = 'INFO'
+    log_file: str = 'dashboard.log'
+    max_file_size: str = '10MB'
+    backup_count: int = 5
+    log_api_calls: bool = True
+    log_user_interactions: bool = True
+    log_exports: bool = True
+    log_imports: bool = True
+
+
+LOGGING_CONFIG = LoggingConfig()
 
 # Performance monitoring
-MONITORING = {
-    'track_load_times': True,
-    'track_api_response_times': True,
-    'track_chart_render_times': True,
-    'track_export_times': True,
-    'alert_slow_requests': True,
-    'slow_request_threshold': 30,
-    'memory_usage_tracking': True,
-}
+@dataclass(frozen=True, slots=True)
+class Monitoring(_FrozenConfig):
+    track_load_times: bool = True
+    track_api_response_times: bool = True
+    track_chart_render_times: bool = True
+    track_export_times: bool = True
+    alert_slow_requests: bool = True
+    slow_request_threshold: int = 30
+    memory_usage_tracking: bool = True
+
+
+MONITORING = Monitoring()
 
 # =============================================================================
 # API RATE LIMITING AND OPTIMIZATION
 # =============================================================================
 
 # Enhanced API management
-API_OPTIMIZATION = {
-    'use_connection_pooling': True,
-    'max_connections': 10,
-    'request_batch_size': 5,
-    'retry_backoff_factor': 1.5,
-    'enable_compression': True,
-    'user_agent': 'GlobalEconomicDashboard/2.0',
-}
\ No newline at end of file
+@dataclass(frozen=True, slots=True)
+class ApiOptimization(_FrozenConfig):
+    use_connection_pooling: bool = True
+    max_connections: int = 10
+    request_batch_size: int = 5
+    retry_backoff_factor: float = 1.5
+    enable_compression: bool = True
+    user_agent: str = 'GlobalEconomicDashboard/2.0'
+
+
+API_OPTIMIZATION = ApiOptimization()
+
+# =============================================================================
+# READ-ONLY VIEWS
+# =============================================================================
+
+# All of the dicts above are reference data, not runtime state. Wrapping them
+# in MappingProxyType makes that explicit: accidental writes raise TypeError,
+# and consumers can share them across threads/workers without defensive copies.
+from types import MappingProxyType as _MappingProxyType
+
+# The lazily-materialized derived structures get the same treatment inside
+# _materialize_derived(); the frozen dataclass sections above are already
+# immutable, so only the remaining literal dicts are wrapped here.
+for _const in ('CACHE_CONFIG', 'API_CONFIG', 'EXPORT_CONFIG',
+               'DATA_VALIDATION'):
+    globals()[_const] = _MappingProxyType(globals()[_const])
+del _const
\ No newline at end of file
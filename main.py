@@ -1,33 +1,113 @@
 # main.py - Enhanced Global Economic Dashboard with Responsive UI
+import aiohttp
+import asyncio
 import dash
 from dash import dcc, html, callback_context
 from dash.dependencies import Input, Output, State, ALL
 import dash_bootstrap_components as dbc
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
+import flask
+from flask.json.provider import JSONProvider
+from flask_caching import Cache
+import orjson
 import requests
 import time
-from datetime import datetime
 import os
+import pathlib
 import io
+import shutil
+import threading
 import base64
+import csv
+import hashlib
+import json
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from fpdf import FPDF
+from PIL import Image
+
+try:  # optional; JIT-compiles the heatmap aggregation when available
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+try:  # optional; Arrow's multithreaded C++ CSV writer beats pandas to_csv
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa = None
+
+try:  # optional; gzips callback responses when installed
+    from flask_compress import Compress
+except ImportError:
+    Compress = None
 from config import (
     SERVER_CONFIG,
     CACHE_CONFIG,
     API_CONFIG,
     DEFAULT_YEARS,
     ECONOMIC_INDICATORS,
-    COUNTRY_GROUPS
+    COUNTRY_GROUPS,
+    INDICATOR_DROPDOWN_OPTIONS,
+    YEAR_MARKS
 )
 
 # Initialize the app. Use suppress_callback_exceptions=True for dynamic outputs
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP, dbc.icons.BOOTSTRAP],
-                suppress_callback_exceptions=True) 
+                suppress_callback_exceptions=True)
 
 app.title = "Global Economic Dashboard"
 
+
+class _OrjsonProvider(JSONProvider):
+    """orjson-backed JSON for Flask's side of the transport boundary.
+
+    Dash serializes callback responses itself (dash._utils.to_json, which
+    routes through plotly's JSON engine), so responses never touch this
+    provider; what it accelerates is parsing incoming callback request
+    bodies via flask.request.get_json.
+    """
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_SERIALIZE_NUMPY).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
+app.server.json = _OrjsonProvider(app.server)
+
+# JSON/base64 responses compress 5-10x; a small CPU cost for far fewer
+# bytes on the wire, which dominates for remote users.
+if Compress is not None:
+    app.server.config['COMPRESS_MIMETYPES'] = ['application/json', 'text/csv', 'text/html']
+    app.server.config['COMPRESS_LEVEL'] = 6
+    Compress(app.server)
+
+# WSGI entry point for production servers (gunicorn main:server)
+server = app.server
+
+# Filesystem-backed cache shared across worker processes. Swap CACHE_TYPE to
+# 'RedisCache' in production if multiple hosts serve the app.
+cache = Cache(app.server, config={
+    'CACHE_TYPE': 'FileSystemCache',
+    'CACHE_DIR': '.cache',
+    'CACHE_DEFAULT_TIMEOUT': 86400,
+})
+
+@app.server.after_request
+def add_asset_cache_headers(response):
+    """Let browsers cache the static assets (custom CSS) aggressively."""
+    if flask.request.path.startswith('/assets/'):
+        response.headers['Cache-Control'] = 'public, max-age=604800, immutable'
+    return response
+
 ALL_INDICATORS = ECONOMIC_INDICATORS
 CHART_TYPES = [
     {"label": "📈 Line Chart", "value": "line"},
@@ -39,35 +119,89 @@ CHART_TYPES = [
     {"label": "📉 Histogram", "value": "histogram"}
 ]
 
-_countries_cache = None
-_cache_timestamp = None
-
 # --- Utility Functions (Same as previous version) ---
 
+# One shared session for all synchronous World Bank calls: connections are
+# pooled and reused (no TCP/TLS handshake per request) and transient 5xx /
+# connection errors are retried with a short backoff.
+_http_session = requests.Session()
+_http_adapter = requests.adapters.HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=requests.adapters.Retry(
+        total=3, backoff_factor=0.2,
+        status_forcelist=(500, 502, 503, 504),
+    ),
+)
+_http_session.mount('http://', _http_adapter)
+_http_session.mount('https://', _http_adapter)
+
+# url -> (etag, parsed json); lets revalidation requests answer from a 304
+_etag_cache = {}
+
+
+def _get_json_revalidated(url, timeout=15):
+    """GET a URL with ETag revalidation, reusing the cached body on a 304."""
+    headers = {}
+    cached = _etag_cache.get(url)
+    if cached:
+        headers['If-None-Match'] = cached[0]
+
+    response = _http_session.get(url, headers=headers, timeout=timeout)
+    if response.status_code == 304 and cached:
+        return cached[1]
+    response.raise_for_status()
+
+    # orjson parses the ~1 MB World Bank payloads 2-3x faster than stdlib json
+    data = orjson.loads(response.content)
+    etag = response.headers.get('ETag')
+    if etag:
+        _etag_cache[url] = (etag, data)
+    return data
+
+
+# On-disk tier under the flask_caching memoize: survives process restarts
+# (deploys, worker recycling) so cold starts skip the network entirely.
+_COUNTRIES_CACHE_FILE = pathlib.Path('.cache/countries.json')
+
+
+@cache.memoize(timeout=86400)
+def _fetch_all_countries_cached():
+    """Fetch the country list, raising on failure.
+
+    Letting errors propagate keeps them out of the memoize cache: only a
+    successful fetch is stored, so the next call after a failure retries
+    the network instead of replaying the fallback for 24 hours.
+    """
+    try:
+        if (_COUNTRIES_CACHE_FILE.exists()
+                and time.time() - _COUNTRIES_CACHE_FILE.stat().st_mtime < 86400):
+            return orjson.loads(_COUNTRIES_CACHE_FILE.read_bytes())
+    except (OSError, ValueError):
+        pass  # unreadable or corrupt cache file; refetch below
+
+    url = "http://api.worldbank.org/v2/country?format=json&per_page=500"
+    data = _get_json_revalidated(url)
+
+    countries = {}
+    if len(data) > 1 and data[1]:
+        for country in data[1]:
+            if country['capitalCity'] and country['longitude'] and country['latitude']:
+                countries[country['name']] = country['id']
+
+    countries = dict(sorted(countries.items()))
+    try:
+        _COUNTRIES_CACHE_FILE.parent.mkdir(exist_ok=True)
+        _COUNTRIES_CACHE_FILE.write_bytes(orjson.dumps(countries))
+    except OSError:
+        pass  # read-only filesystem; serve without the disk tier
+    return countries
+
+
 def fetch_all_countries():
     """Fetch all available countries from World Bank API."""
-    global _countries_cache, _cache_timestamp
-    
-    if (_countries_cache is not None and _cache_timestamp is not None and 
-        (datetime.now() - _cache_timestamp).seconds < 86400):
-        return _countries_cache
-
     try:
-        url = "http://api.worldbank.org/v2/country?format=json&per_page=500"
-        response = requests.get(url, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        
-        countries = {}
-        if len(data) > 1 and data[1]:
-            for country in data[1]:
-                if country['capitalCity'] and country['longitude'] and country['latitude']:
-                    countries[country['name']] = country['id']
-                
-        _countries_cache = dict(sorted(countries.items()))
-        _cache_timestamp = datetime.now()
-        return _countries_cache
-        
+        return _fetch_all_countries_cached()
     except Exception as e:
         print(f"Error fetching countries: {e}")
         return {
@@ -76,71 +210,315 @@ def fetch_all_countries():
             'Brazil': 'BRA', 'Canada': 'CAN', 'Russia': 'RUS', 'South Korea': 'KOR',
         }
 
+# Cap on simultaneous World Bank requests; doubles as rate limiting, so the
+# old per-request time.sleep pacing is no longer needed.
+MAX_CONCURRENT_REQUESTS = 16
+
+
+async def _fetch_json(session, sem, url, params):
+    """GET one URL and return its decoded JSON payload."""
+    async with sem:
+        async with session.get(url, params=params,
+                               timeout=aiohttp.ClientTimeout(total=10)) as response:
+            response.raise_for_status()
+            return orjson.loads(await response.read())
+
+
+async def _gather_country_data(country_codes, indicator_codes, start_year, end_year):
+    """Fetch every requested series in one batched call (plus pagination).
+
+    The v2 API accepts ';'-joined country and indicator codes, so the whole
+    selection collapses into a single request per page instead of one request
+    per (country, indicator) pair. Extra pages are fetched concurrently.
+    """
+    url = (f"http://api.worldbank.org/v2/country/{';'.join(country_codes)}"
+           f"/indicator/{';'.join(indicator_codes)}")
+    params = {
+        'source': 2,
+        'format': 'json',
+        'date': f"{start_year}:{end_year}",
+        'per_page': 20000
+    }
+
+    sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        try:
+            first = await _fetch_json(session, sem, url, {**params, 'page': 1})
+        except Exception as e:
+            print(f"Error fetching indicator data: {e}")
+            return []
+
+        pages_data = [first]
+        pages = first[0].get('pages', 1) if first and isinstance(first[0], dict) else 1
+        if pages > 1:
+            results = await asyncio.gather(
+                *(_fetch_json(session, sem, url, {**params, 'page': page})
+                  for page in range(2, pages + 1)),
+                return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, Exception):
+                    print(f"Error fetching indicator data page: {result}")
+                else:
+                    pages_data.append(result)
+    return pages_data
+
+
 def fetch_country_data(country_codes, start_year=2010, end_year=2023, indicators=None):
-    """Fetch data from World Bank API for given countries and indicators."""
+    """Fetch data from World Bank API for given countries and indicators.
+
+    Thin wrapper that normalizes the list arguments into sorted tuples so
+    identical selections hit the same memoized cache entry regardless of
+    selection order.
+    """
     if isinstance(country_codes, str):
         country_codes = [country_codes]
-        
+
     if indicators is None:
         indicators = list(ALL_INDICATORS.keys())
-        
-    all_data = []
-    
-    for country_code in country_codes:
-        for indicator_name in indicators:
-            if indicator_name not in ALL_INDICATORS:
+
+    try:
+        return _fetch_country_data_cached(
+            tuple(sorted(country_codes)), start_year, end_year,
+            tuple(sorted(indicators))
+        )
+    except RuntimeError:
+        # Fetch failed; nothing was memoized, so the next call retries.
+        return pd.DataFrame()
+
+
+@cache.memoize(timeout=3600)
+def _fetch_country_data_cached(country_codes, start_year, end_year, indicators):
+    """Issue one batched request (per page) for the whole selection.
+
+    Aliased display names that share a World Bank code are fetched once and
+    fanned back out to every selected alias when the response is parsed.
+    """
+    # code -> selected display names; duplicates collapse into one request.
+    # Single .get probe per name instead of an "in" check plus a subscript.
+    code_to_names = {}
+    for indicator_name in indicators:
+        indicator_code = ALL_INDICATORS.get(indicator_name)
+        if indicator_code is not None:
+            code_to_names.setdefault(indicator_code, []).append(indicator_name)
+
+    if not code_to_names:
+        return pd.DataFrame()
+
+    pages_data = asyncio.run(
+        _gather_country_data(country_codes, list(code_to_names), start_year, end_year)
+    )
+    if not pages_data:
+        # The first page failed outright. Raise rather than return, so the
+        # blip's empty frame is never memoized for the next hour; a genuinely
+        # empty (but successful) response below still caches normally.
+        raise RuntimeError("World Bank indicator request failed")
+
+    # Build one plain list per column instead of a dict per row: pandas turns
+    # homogeneous lists into typed arrays directly, skipping the per-row dict
+    # allocation and the object-dtype inference pass.
+    codes, names_col, inds, years, values = [], [], [], [], []
+    for data in pages_data:
+        if not (len(data) > 1 and data[1]):
+            continue
+        for entry in data[1]:
+            if entry['value'] is None:
                 continue
-                            
-            indicator_code = ALL_INDICATORS[indicator_name]
-            url = f"http://api.worldbank.org/v2/country/{country_code}/indicator/{indicator_code}"
-            params = {
-                'format': 'json',
-                'date': f"{start_year}:{end_year}",
-                'per_page': 1000
-            }
-                        
-            try:
-                response = requests.get(url, params=params, timeout=10)
-                response.raise_for_status()
-                data = response.json()
-                                
-                if len(data) > 1 and data[1]:
-                    for entry in data[1]:
-                        if entry['value'] is not None:
-                            all_data.append({
-                                'country_code': country_code,
-                                'country_name': entry['country']['value'],
-                                'indicator': indicator_name,
-                                'year': int(entry['date']),
-                                'value': float(entry['value'])
-                            })
-                                
-                time.sleep(0.05)
-            except Exception as e:
-                print(f"Error fetching {indicator_name} for {country_code}: {e}")
+            names = code_to_names.get(entry['indicator']['id'])
+            if not names:
                 continue
+            code = entry.get('countryiso3code') or entry['country']['id']
+            name = entry['country']['value']
+            year = int(entry['date'])
+            value = float(entry['value'])
+            for indicator_name in names:
+                codes.append(code)
+                names_col.append(name)
+                inds.append(indicator_name)
+                years.append(year)
+                values.append(value)
 
-    if all_data:
-        df = pd.DataFrame(all_data)
-        return df.sort_values(['country_name', 'indicator', 'year'])
-    else:
+    if not codes:
         return pd.DataFrame()
 
+    df = pd.DataFrame({
+        'country_code': pd.Categorical(codes),
+        'country_name': pd.Categorical(names_col),
+        'indicator': pd.Categorical(inds),
+        'year': np.asarray(years, dtype=np.int16),
+        # float64 on purpose: GDP-scale values (~1e13) lose ~1e6 of
+        # precision in float32, which would flow straight into exports.
+        'value': np.asarray(values, dtype=np.float64),
+    })
+    return df.sort_values(['country_name', 'indicator', 'year'],
+                          kind='stable', ignore_index=True)
+
+
+def _compact_dtypes(df):
+    """Downcast a records-built frame to the narrowest dtypes that fit.
+
+    The API path gets these dtypes at construction time; this covers frames
+    rehydrated from records (imported CSVs). Years fit in int16 and the
+    repetitive string columns become categories. Values stay float64:
+    GDP-scale magnitudes don't survive float32.
+    """
+    df['year'] = df['year'].astype('int16')
+    df['value'] = pd.to_numeric(df['value'])
+    for col in ('country_code', 'country_name', 'indicator'):
+        df[col] = df[col].astype('category')
+    return df
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _grouped_mean_kernel(country_idx, year_idx, values, n_countries, n_years):
+        """Accumulate (country, year) sums/counts and divide in parallel."""
+        sums = np.zeros((n_countries, n_years))
+        counts = np.zeros((n_countries, n_years))
+        for i in range(values.shape[0]):
+            sums[country_idx[i], year_idx[i]] += values[i]
+            counts[country_idx[i], year_idx[i]] += 1.0
+        for r in prange(n_countries):
+            for c in range(n_years):
+                if counts[r, c] > 0.0:
+                    sums[r, c] /= counts[r, c]
+        return sums
+
+
+def _heatmap_grid(indicator_data):
+    """Build the (z, years, countries) grid behind the heatmap trace.
+
+    Uses the numba kernel over factorized codes when numba is installed;
+    otherwise falls back to the pandas groupby path.
+    """
+    if njit is not None:
+        country_idx, countries = pd.factorize(indicator_data['country_name'], sort=True)
+        year_idx, years = pd.factorize(indicator_data['year'], sort=True)
+        z = _grouped_mean_kernel(
+            country_idx, year_idx,
+            indicator_data['value'].to_numpy(dtype=np.float64),
+            len(countries), len(years)
+        )
+        return z, np.asarray(years), np.asarray(countries)
+
+    pivot_data = (indicator_data
+                  .groupby(['country_name', 'year'], observed=True, sort=False)['value']
+                  .mean()
+                  .unstack('year', fill_value=0)
+                  .sort_index())
+    return pivot_data.values, pivot_data.columns.to_numpy(), pivot_data.index.to_numpy()
+
+
+# Server-side home for the working DataFrame. dcc.Store only carries an
+# opaque key, so callbacks skip the O(N) pd.DataFrame(records) rebuild that
+# every interaction used to pay. Frames live in the shared filesystem cache
+# (pickled by flask_caching), so a key minted by one gunicorn worker
+# resolves in every other worker too.
+_DF_CACHE_TTL = 1800
+
+
+def _store_df(df):
+    """Park a DataFrame server-side and return the key to put in dcc.Store."""
+    key = uuid.uuid4().hex
+    cache.set(f'df:{key}', df, timeout=_DF_CACHE_TTL)
+    return key
+
+
+def _df_from_store(stored_data):
+    """Resolve a data-store payload back to a DataFrame.
+
+    String payloads are cache keys; anything else — columnar dict-of-lists
+    from imported-data-store, or records from older sessions still open in
+    a browser tab — rehydrates through the DataFrame constructor, which is
+    one typed pass per column for the columnar form.
+    """
+    if isinstance(stored_data, str):
+        df = cache.get(f'df:{stored_data}')
+        return df if df is not None else pd.DataFrame()
+    return pd.DataFrame(stored_data)
+
+
+# DataFrames aren't hashable, so the memoized builder below receives a stable
+# key and looks the sub-frame itself up here. Bounded alongside the builder's
+# LRU so stale frames don't accumulate. The per-indicator groups are built
+# once per frame: one groupby pass instead of a full boolean scan per chart.
+_chart_df_registry = {}
+_CHART_DF_REGISTRY_MAX = 32
+_indicator_groups_cache = {}  # df_hash -> {indicator: sub-frame}
+_INDICATOR_GROUPS_MAX = 8
+
+# The in-process caches above (and the image caches further down) are hit
+# from gunicorn's worker threads; this lock keeps their check-evict-insert
+# sequences atomic.
+_cache_lock = threading.Lock()
+
+
+class _RegistryMiss(Exception):
+    """A registry entry was evicted between insertion and the builder's
+    lookup; the caller reinserts and retries."""
+
+
 def create_chart(df, indicator, chart_type="line", countries=None):
-    """Create a Plotly figure."""
+    """Create a Plotly figure.
+
+    Figure construction is memoized on (data, indicator, chart type,
+    countries): toggling back to an already-rendered combination returns the
+    cached figure instead of rebuilding it.
+    """
     if df.empty:
         return go.Figure().add_annotation(
             text="No data available", xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False, font=dict(size=16, color="gray")
-        )
-        
-    indicator_data = df[df['indicator'] == indicator].copy()
-    
+        ).to_plotly_json()
+
+    df_hash = hash(pd.util.hash_pandas_object(df, index=False).values.tobytes())
+    with _cache_lock:
+        groups = _indicator_groups_cache.get(df_hash)
+    if groups is None:
+        groups = {name: sub for name, sub in
+                  df.groupby('indicator', observed=True, sort=False)}
+        with _cache_lock:
+            while len(_indicator_groups_cache) >= _INDICATOR_GROUPS_MAX:
+                _indicator_groups_cache.pop(next(iter(_indicator_groups_cache)))
+            _indicator_groups_cache[df_hash] = groups
+
+    indicator_data = groups.get(indicator)
+    if indicator_data is None or indicator_data.empty:
+        return go.Figure().add_annotation(
+            text=f"No data available for {indicator}", xref="paper", yref="paper",
+            x=0.5, y=0.5, showarrow=False, font=dict(size=16, color="gray")
+        ).to_plotly_json()
+
+    df_key = (df_hash, indicator)
+    with _cache_lock:
+        while len(_chart_df_registry) >= _CHART_DF_REGISTRY_MAX:
+            _chart_df_registry.pop(next(iter(_chart_df_registry)))
+        _chart_df_registry[df_key] = indicator_data
+    countries_key = tuple(countries) if countries else None
+    try:
+        return _build_chart_cached(df_key, indicator, chart_type, countries_key)
+    except _RegistryMiss:
+        # Another thread's insertions evicted the entry before the builder
+        # looked it up; lru_cache doesn't cache exceptions, so reinsert and
+        # retry once.
+        with _cache_lock:
+            _chart_df_registry[df_key] = indicator_data
+        return _build_chart_cached(df_key, indicator, chart_type, countries_key)
+
+
+@lru_cache(maxsize=128)
+def _build_chart_cached(df_key, indicator, chart_type, countries):
+    with _cache_lock:
+        indicator_data = _chart_df_registry.get(df_key)
+    if indicator_data is None:
+        raise _RegistryMiss(df_key)
+    indicator_data = indicator_data.copy()
+
     if indicator_data.empty:
         return go.Figure().add_annotation(
             text=f"No data available for {indicator}", xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False, font=dict(size=16, color="gray")
-        )
+        ).to_plotly_json()
 
     if countries and 'country_code' in indicator_data.columns:
         indicator_data = indicator_data[indicator_data['country_code'].isin(countries)]
@@ -149,7 +527,7 @@ def create_chart(df, indicator, chart_type="line", countries=None):
          return go.Figure().add_annotation(
             text=f"No data available for {indicator} with selected countries", xref="paper", yref="paper",
             x=0.5, y=0.5, showarrow=False, font=dict(size=14, color="gray")
-        )
+        ).to_plotly_json()
         
     if chart_type == "line":
         fig = px.line(indicator_data, x="year", y="value", color="country_name",
@@ -177,11 +555,9 @@ def create_chart(df, indicator, chart_type="line", countries=None):
                     labels={'value': indicator, 'country_name': 'Country'})
         fig.update_xaxes(tickangle=45)
     elif chart_type == "heatmap":
-        pivot_data = indicator_data.pivot_table(
-            values='value', index='country_name', columns='year', aggfunc='mean'
-        ).fillna(0)
+        z, years, country_names = _heatmap_grid(indicator_data)
         fig = go.Figure(data=go.Heatmap(
-            z=pivot_data.values, x=pivot_data.columns, y=pivot_data.index,
+            z=z, x=years, y=country_names,
             colorscale='Viridis',
             hovertemplate='Year: %{x}<br>Country: %{y}<br>Value: %{z}<extra></extra>'
         ))
@@ -199,31 +575,214 @@ def create_chart(df, indicator, chart_type="line", countries=None):
         legend=dict(orientation="h", yanchor="bottom", y=-0.3, xanchor="center", x=0.5),
         title_font_size=16, title_x=0.5,
         margin=dict(l=50, r=50, t=80, b=100),
-        plot_bgcolor='rgba(248,249,250,0.8)', paper_bgcolor='white'
+        plot_bgcolor='rgba(248,249,250,0.8)', paper_bgcolor='white',
+        # consumers read these back instead of parsing the emoji title
+        meta={'indicator': indicator, 'chart_type': chart_type}
     )
-        
-    return fig
+
+    # Hand Dash the raw plotly dict: the callback response then skips the
+    # slow Figure -> dict validation pass on every update.
+    return fig.to_plotly_json()
 
 def fig_to_base64(fig):
-    """Converts a Plotly figure to a base64 encoded PNG image."""
-    img_bytes = fig.to_image(format="png", width=800, height=500)
+    """Converts a Plotly figure to a base64 encoded PNG image.
+
+    Rendered at the size the PDF actually embeds (180 mm wide) so FPDF never
+    has to downscale.
+    """
+    img_bytes = fig.to_image(format="png", width=720, height=450)
     return base64.b64encode(img_bytes).decode()
 
+
+# digest -> decoded PIL image; repeated exports of unchanged charts skip
+# the base64 decode and PNG parse entirely
+_decoded_image_cache = OrderedDict()
+_DECODED_IMAGE_CACHE_MAX = 64
+
+
+def _decode_chart_image(img_b64):
+    """Decode a chart's base64 PNG once, even across repeated exports.
+
+    Cache entries are keyed by a 16-byte blake2b digest, so lookups compare
+    short binary keys rather than multi-hundred-KB base64 strings.
+    """
+    key = hashlib.blake2b(img_b64.encode(), digest_size=16).digest()
+    with _cache_lock:
+        image = _decoded_image_cache.get(key)
+        if image is not None:
+            _decoded_image_cache.move_to_end(key)
+            return image
+
+    image = Image.open(io.BytesIO(base64.b64decode(img_b64)))
+    with _cache_lock:
+        _decoded_image_cache[key] = image
+        if len(_decoded_image_cache) > _DECODED_IMAGE_CACHE_MAX:
+            _decoded_image_cache.popitem(last=False)
+    return image
+
+# Kaleido spins up a headless browser per render (~hundreds of ms), so PNGs
+# for unchanged figures are reused from this small LRU instead.
+_png_cache = OrderedDict()
+_PNG_CACHE_MAX = 64
+
+
+def _fig_json_default(obj):
+    """Lossless fallback encoder for figure values orjson can't natively.
+
+    Object-dtype arrays (country names) fall through OPT_SERIALIZE_NUMPY;
+    str() would elide them past 1000 elements and let distinct figures
+    collide on one cache key, so arrays are expanded to lists instead.
+    """
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    return str(obj)
+
+
+def render_fig_png(fig_dict):
+    """Render a figure dict to base64 PNG, reusing prior renders when the
+    figure hasn't changed."""
+    key = hashlib.blake2b(
+        orjson.dumps(fig_dict,
+                     option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_SORT_KEYS,
+                     default=_fig_json_default),
+        digest_size=16
+    ).hexdigest()
+
+    with _cache_lock:
+        cached = _png_cache.get(key)
+        if cached is not None:
+            _png_cache.move_to_end(key)
+            return cached
+
+    try:
+        img_b64 = fig_to_base64(go.Figure(fig_dict))
+    except Exception:
+        # Figure dict might be empty or malformed
+        return None
+
+    with _cache_lock:
+        _png_cache[key] = img_b64
+        if len(_png_cache) > _PNG_CACHE_MAX:
+            _png_cache.popitem(last=False)
+    return img_b64
+
+_EXPORT_COLUMNS = ['country_code', 'country_name', 'indicator', 'year', 'value']
+
+# Shared across exports so the worker threads are created once, not per click.
+_CSV_EXPORT_WORKERS = os.cpu_count() or 4
+_csv_export_executor = ThreadPoolExecutor(max_workers=_CSV_EXPORT_WORKERS)
+_CSV_SLICE_MIN_ROWS = 8192
+
+
+def _write_csv_slice(table, offset, length):
+    """Serialize one row-range of the table to an in-memory buffer."""
+    sink = io.BytesIO()
+    pa_csv.write_csv(
+        table.slice(offset, length), sink,
+        write_options=pa_csv.WriteOptions(include_header=False, batch_size=8192)
+    )
+    sink.seek(0)
+    return sink
+
+
+def _write_csv_parallel(table, filepath):
+    """Format row ranges on all cores, then concatenate them in order.
+
+    Arrow releases the GIL while formatting, so the slices serialize truly
+    in parallel; the single ordered pass through copyfileobj keeps the
+    on-disk row order identical to the sequential writer.
+    """
+    n_slices = min(_CSV_EXPORT_WORKERS,
+                   max(1, table.num_rows // _CSV_SLICE_MIN_ROWS))
+    if n_slices <= 1:
+        pa_csv.write_csv(table, filepath,
+                         write_options=pa_csv.WriteOptions(batch_size=8192))
+        return
+
+    bounds = np.linspace(0, table.num_rows, n_slices + 1, dtype=int)
+    futures = [
+        _csv_export_executor.submit(_write_csv_slice, table, int(start), int(stop - start))
+        for start, stop in zip(bounds, bounds[1:])
+    ]
+
+    header = io.BytesIO()
+    pa_csv.write_csv(table.slice(0, 0), header,
+                     write_options=pa_csv.WriteOptions())
+    with open(filepath, 'wb') as f:
+        f.write(header.getvalue())
+        for future in futures:
+            shutil.copyfileobj(future.result(), f)
+
+
+def _export_records_to_csv(records, filename="economic_data.csv"):
+    """Write a list of row dicts to CSV without building a DataFrame.
+
+    csv.DictWriter's C writer plus a 1 MB write buffer makes this cheaper
+    than the pandas round-trip for payloads that are already records.
+    """
+    try:
+        export_dir = os.path.join("exports", "csv")
+        os.makedirs(export_dir, exist_ok=True)
+        filepath = os.path.join(export_dir, filename)
+        with open(filepath, 'w', newline='', buffering=1024 * 1024) as f:
+            writer = csv.DictWriter(f, fieldnames=_EXPORT_COLUMNS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(records)
+        return os.path.abspath(filepath)
+    except Exception as e:
+        print(f"Error creating CSV: {e}")
+        return None
+
+
 def export_to_csv(df, filename="economic_data.csv"):
     """Export data to CSV format in exports/csv folder."""
     try:
         export_dir = os.path.join("exports", "csv")
         os.makedirs(export_dir, exist_ok=True)
         filepath = os.path.join(export_dir, filename)
-        export_df = df[['country_code', 'country_name', 'indicator', 'year', 'value']].copy()
-        export_df.to_csv(filepath, index=False)
+        if pa is not None:
+            # Arrow serializes in C++ across threads, skipping the per-cell
+            # Python formatting that dominates pandas to_csv on big frames.
+            table = pa.Table.from_pandas(df[_EXPORT_COLUMNS], preserve_index=False)
+            _write_csv_parallel(table, filepath)
+        else:
+            # Column projection via to_csv avoids duplicating every row first
+            df.to_csv(filepath, index=False, columns=_EXPORT_COLUMNS)
         return os.path.abspath(filepath)
     except Exception as e:
         print(f"Error creating CSV: {e}")
         return None
 
+def _iter_chart_images_for_export(df, ui_state, chart_types):
+    """Yield one rendered chart at a time for the PDF.
+
+    With the tabbed layout only the visible chart exists in the browser, so
+    the Kaleido renders happen here, when the user actually exports. Each
+    chart is built, rendered and handed to the PDF writer before the next
+    one starts, so peak memory stays at a single image regardless of how
+    many indicators the report covers.
+    """
+    indicators = (ui_state or {}).get('indicators', [])
+    countries = (ui_state or {}).get('countries', None)
+    active_indicators = [ind for ind in indicators if ind in df['indicator'].values]
+    chart_types = list(chart_types or [])
+    chart_types += ['line'] * (len(active_indicators) - len(chart_types))
+
+    for indicator, chart_type in zip(active_indicators, chart_types):
+        fig_dict = create_chart(df, indicator, chart_type, countries)
+        yield {
+            'indicator': indicator,
+            'chart_type': chart_type,
+            'image_b64': render_fig_png(fig_dict),
+        }
+
+
 def export_to_pdf(df, chart_list, filename="economic_report.pdf"):
-    """Export data, summary, and charts to PDF format in exports/pdf folder."""
+    """Export data, summary, and charts to PDF format in exports/pdf folder.
+
+    chart_list may be any iterable of chart dicts, including a generator:
+    charts are consumed one page at a time, never held all at once.
+    """
     try:
         export_dir = os.path.join("exports", "pdf")
         os.makedirs(export_dir, exist_ok=True)
@@ -236,7 +795,7 @@ def export_to_pdf(df, chart_list, filename="economic_report.pdf"):
         pdf.ln(5)
         
         pdf.set_font("Arial", 'I', 10)
-        timestamp_str = datetime.now().strftime('%B %d, %Y at %H:%M UTC')
+        timestamp_str = time.strftime('%B %d, %Y at %H:%M UTC')
         pdf.cell(0, 8, txt=f"Generated on: {timestamp_str}", ln=True, align="C")
         pdf.ln(10)
         
@@ -272,7 +831,7 @@ def export_to_pdf(df, chart_list, filename="economic_report.pdf"):
                 pdf.ln(1)
                 
                 if img_data:
-                    pdf.image(io.BytesIO(base64.b64decode(img_data)), w=180)
+                    pdf.image(_decode_chart_image(img_data), w=180)
                     pdf.ln(5)
                 
                 if pdf.get_y() > 250:
@@ -355,7 +914,7 @@ app.layout = dbc.Container([
                     html.Label("📊 Select Economic Indicators", className="fw-bold mb-2"),
                     dcc.Dropdown(
                         id="indicator-dropdown",
-                        options=[{"label": ind, "value": ind} for ind in sorted(ALL_INDICATORS.keys())],
+                        options=list(INDICATOR_DROPDOWN_OPTIONS),
                         value=["GDP (Current US$)", "GDP Growth (Annual %)"],
                         multi=True, className="mb-2"
                     ),
@@ -369,9 +928,9 @@ app.layout = dbc.Container([
                 dbc.Col([
                     html.Label("📅 Year Range", className="fw-bold mb-2"),
                     dcc.RangeSlider(
-                        id="year-slider", min=2000, max=2023, step=1, value=[2018, 2023],
-                        marks={y: {'label': str(y), 'style': {'fontSize': '10px'}} 
-                               for y in range(2000, 2024, 4)},
+                        id="year-slider", min=DEFAULT_YEARS['min_year'],
+                        max=DEFAULT_YEARS['max_year'], step=1, value=[2018, 2023],
+                        marks=YEAR_MARKS,
                         tooltip={"placement": "bottom", "always_visible": True}, className="mb-4"
                     ),
                     
@@ -433,9 +992,8 @@ app.layout = dbc.Container([
     dcc.Store(id="data-store", storage_type='session'),
     dcc.Store(id="imported-data-store", storage_type='session'),
     dcc.Store(id="countries-store", storage_type='session'),
-    dcc.Store(id="ui-state-store", storage_type='session'),
-    dcc.Store(id="chart-images-store", data=[], storage_type='session') 
-    
+    dcc.Store(id="ui-state-store", storage_type='session')
+
 ], fluid=True, className="px-4")
 
 # --- Callbacks ---
@@ -507,7 +1065,10 @@ def handle_file_upload(contents, filename):
     df, message = parse_uploaded_csv(contents, filename)
     
     if df is not None:
-        return df.to_dict('records'), dbc.Alert(message, color="success", className="mt-2"), False
+        # Columnar dict-of-lists: one key per column instead of one dict per
+        # row, so the store JSON is smaller and the frame rebuilds with
+        # per-column (not per-row) dtype inference.
+        return df.to_dict('list'), dbc.Alert(message, color="success", className="mt-2"), False
     else:
         return {}, dbc.Alert(message, color="danger", className="mt-2"), True
 
@@ -532,17 +1093,18 @@ def fetch_and_display_data(fetch_clicks, import_clicks, selected_countries, sele
     ctx = callback_context
     if not ctx.triggered:
         if existing_data and existing_ui_state:
-            df = pd.DataFrame(existing_data)
-            indicators = existing_ui_state.get('indicators', [])
-            countries = existing_ui_state.get('countries', None)
-            charts, export_section = create_charts_and_export(df, indicators, countries)
-            return charts, export_section, {"display": "block"}, existing_data, existing_ui_state
+            df = _df_from_store(existing_data)
+            if not df.empty:
+                indicators = existing_ui_state.get('indicators', [])
+                countries = existing_ui_state.get('countries', None)
+                charts, export_section = create_charts_and_export(df, indicators, countries)
+                return charts, export_section, {"display": "block"}, existing_data, existing_ui_state
         return [], "", {"display": "none"}, {}, {}
         
     trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
     
     if trigger_id == "use-imported-btn" and import_clicks and imported_data:
-        df = pd.DataFrame(imported_data)
+        df = _compact_dtypes(pd.DataFrame(imported_data))
         indicators_in_data = df['indicator'].unique().tolist()
         data_source = "imported"
     elif trigger_id == "fetch-data-btn" and fetch_clicks and selected_countries and selected_indicators:
@@ -568,21 +1130,23 @@ def fetch_and_display_data(fetch_clicks, import_clicks, selected_countries, sele
         "indicators": indicators_in_data,
         "countries": selected_countries if data_source == "api" else df['country_code'].unique().tolist()
     }
-    
-    return charts, export_section, {"display": "block"}, df.to_dict('records'), ui_state
+
+    return charts, export_section, {"display": "block"}, _store_df(df), ui_state
 
 
 def create_charts_and_export(df, indicators, countries):
-    """Helper function to generate dynamic charts and export section."""
-    charts = []
-    
+    """Helper function to generate the tabbed charts and export section."""
     if not isinstance(indicators, list):
         indicators = list(indicators)
 
-    for i, indicator in enumerate(indicators):
-        if indicator not in df['indicator'].values:
-            continue
-            
+    active_indicators = [ind for ind in indicators if ind in df['indicator'].values]
+
+    # One tab per indicator, but only the first tab's figure is built here;
+    # the rest stay empty until their tab is activated (see
+    # render_active_tab_chart), so K indicators no longer mean K figure
+    # builds per interaction.
+    tabs = []
+    for i, indicator in enumerate(active_indicators):
         chart_card = dbc.Card([
             dbc.CardHeader([
                 dbc.Row([
@@ -602,14 +1166,16 @@ def create_charts_and_export(df, indicators, countries):
                 dcc.Loading([
                     dcc.Graph(
                         id={"type": "chart", "index": i},
-                        figure=create_chart(df, indicator, "line", countries),
-                        config={'displayModeBar': False} 
+                        figure=create_chart(df, indicator, "line", countries) if i == 0 else {},
+                        config={'displayModeBar': False}
                     )
                 ])
             ])
         ], className="mb-4 shadow-sm")
-        
-        charts.append(chart_card)
+
+        tabs.append(dbc.Tab(chart_card, label=indicator, tab_id=f"t{i}"))
+
+    charts = dbc.Tabs(tabs, id="chart-tabs", active_tab="t0") if tabs else []
 
     export_section = dbc.Card([
         dbc.CardHeader([html.H4("📁 Export Data", className="mb-0 text-success")]),
@@ -637,48 +1203,37 @@ def create_charts_and_export(df, indicators, countries):
     return charts, export_section
 
 @app.callback(
-    Output("chart-images-store", "data"),
-    [Input({"type": "chart", "index": ALL}, "figure"),
-     Input({"type": "chart-type", "index": ALL}, "value")],
-    [State("ui-state-store", "data")]
+    Output({"type": "chart", "index": ALL}, "figure", allow_duplicate=True),
+    Input("chart-tabs", "active_tab"),
+    [State({"type": "chart", "index": ALL}, "figure"),
+     State({"type": "chart-type", "index": ALL}, "value"),
+     State("data-store", "data"),
+     State("ui-state-store", "data")],
+    prevent_initial_call=True
 )
-def store_chart_images(figures, chart_types, ui_state):
-    """Stores the base64 image data and metadata for each chart."""
-    if not figures or not ui_state:
-        return []
-    
+def render_active_tab_chart(active_tab, figures, chart_types, stored_data, ui_state):
+    """Build the newly activated tab's figure; every other tab is untouched."""
+    no_updates = [dash.no_update] * len(figures)
+    if not active_tab or not stored_data or not ui_state:
+        return no_updates
+
+    idx = int(active_tab[1:])
+    if idx >= len(figures) or figures[idx]:
+        return no_updates  # already rendered (or by the chart-type callback)
+
+    df = _df_from_store(stored_data)
+    if df.empty:
+        return no_updates
+
     indicators = ui_state.get('indicators', [])
-    chart_data_list = []
-    
-    num_figures = len(figures)
-    active_indicators = [ind for ind in indicators if ind in [f['layout']['title']['text'].split(' - ')[0].split('📈 ')[-1].split('📊 ')[-1].split('🎯 ')[-1].split('📋 ')[-1].split('🗂️ ')[-1].split('🌡️ ')[-1].split('📉 ')[-1] for f in figures if f.get('layout') and f['layout'].get('title')]]
-    
-    if len(figures) != len(active_indicators):
-        active_indicators = active_indicators[:num_figures]
-        chart_types = chart_types[:num_figures]
-    
-    for i in range(num_figures):
-        fig_dict = figures[i]
-        indicator = active_indicators[i] if i < len(active_indicators) else 'Unknown Indicator'
-        chart_type = chart_types[i] if i < len(chart_types) else 'line'
-
-        if fig_dict:
-            try:
-                fig = go.Figure(fig_dict)
-                img_b64 = fig_to_base64(fig)
-            except Exception as e:
-                # Handle cases where the figure dict might be empty or malformed
-                img_b64 = None
-        else:
-            img_b64 = None
+    countries = ui_state.get('countries', None)
+    active_indicators = [ind for ind in indicators if ind in df['indicator'].values]
+    if idx >= len(active_indicators):
+        return no_updates
 
-        chart_data_list.append({
-            'indicator': indicator,
-            'chart_type': chart_type,
-            'image_b64': img_b64
-        })
-        
-    return chart_data_list
+    chart_type = chart_types[idx] if idx < len(chart_types) and chart_types[idx] else 'line'
+    no_updates[idx] = create_chart(df, active_indicators[idx], chart_type, countries)
+    return no_updates
 
 @app.callback(
     Output({"type": "chart", "index": ALL}, "figure"),
@@ -689,32 +1244,54 @@ def store_chart_images(figures, chart_types, ui_state):
 def update_chart_types(chart_types, stored_data, ui_state):
     if not stored_data or not ui_state:
         return []
-        
-    df = pd.DataFrame(stored_data)
+
+    # Only one dropdown changes per interaction; rebuild that chart and
+    # leave the rest untouched with dash.no_update.
+    changed_index = None
+    ctx = callback_context
+    if ctx.triggered:
+        try:
+            changed_index = json.loads(ctx.triggered[0]['prop_id'].split('.')[0])['index']
+        except (ValueError, KeyError):
+            changed_index = None
+
+    df = _df_from_store(stored_data)
+    if df.empty:
+        return [dash.no_update] * len(chart_types)
     indicators = ui_state.get('indicators', [])
     countries = ui_state.get('countries', None)
-    
+
     figures = []
-    
+
     active_indicators = [ind for ind in indicators if ind in df['indicator'].values]
 
     if len(chart_types) != len(active_indicators):
         chart_types = ['line'] * len(active_indicators)
-    
-    for chart_type, indicator in zip(chart_types, active_indicators):
-        fig = create_chart(df, indicator, chart_type, countries)
-        figures.append(fig)
-        
+
+    for i, (chart_type, indicator) in enumerate(zip(chart_types, active_indicators)):
+        if changed_index is not None and i != changed_index:
+            figures.append(dash.no_update)
+        else:
+            figures.append(create_chart(df, indicator, chart_type, countries))
+
     return figures
 
+# Built once: the icon element and message templates never change between
+# exports, only the file name does.
+_ALERT_ICON = html.I(className="bi bi-check-circle me-2")
+_CSV_MSG_TMPL = "✅ CSV exported successfully to: exports/csv/{name}"
+_PDF_MSG_TMPL = "✅ PDF exported successfully to: exports/pdf/{name}"
+
+
 @app.callback(
     Output("export-status", "children"),
     [Input("export-csv-btn", "n_clicks"),
      Input("export-pdf-btn", "n_clicks")],
     [State("data-store", "data"),
-     State("chart-images-store", "data")]
+     State("ui-state-store", "data"),
+     State({"type": "chart-type", "index": ALL}, "value")]
 )
-def handle_exports(csv_clicks, pdf_clicks, stored_data, chart_images_data):
+def handle_exports(csv_clicks, pdf_clicks, stored_data, ui_state, chart_types):
     if not stored_data:
         return ""
         
@@ -723,26 +1300,38 @@ def handle_exports(csv_clicks, pdf_clicks, stored_data, chart_images_data):
         return ""
         
     trigger_id = ctx.triggered[0]['prop_id'].split('.')[0]
-    df = pd.DataFrame(stored_data)
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-    
+    # time.strftime formats straight from the C struct tm; no datetime
+    # object allocation on the callback path
+    timestamp = time.strftime('%Y%m%d_%H%M%S')
+
     if trigger_id == "export-csv-btn" and csv_clicks:
-        filepath = export_to_csv(df, f"economic_data_{timestamp}.csv")
+        if isinstance(stored_data, list) and stored_data:
+            # Legacy records payload: stream the dicts straight to csv
+            # without paying for a DataFrame construction first.
+            filepath = _export_records_to_csv(stored_data, f"economic_data_{timestamp}.csv")
+        else:
+            df = _df_from_store(stored_data)
+            if df.empty:
+                return dbc.Alert("❌ Data expired, please fetch again before exporting", color="danger")
+            filepath = export_to_csv(df, f"economic_data_{timestamp}.csv")
         if filepath:
             return dbc.Alert(
-                [html.I(className="bi bi-check-circle me-2"), 
-                  f"✅ CSV exported successfully to: exports/csv/{os.path.basename(filepath)}"],
+                [_ALERT_ICON, _CSV_MSG_TMPL.format(name=os.path.basename(filepath))],
                 color="success"
             )
         else:
             return dbc.Alert("❌ CSV export failed", color="danger")
             
     elif trigger_id == "export-pdf-btn" and pdf_clicks:
-        filepath = export_to_pdf(df, chart_images_data, f"economic_report_{timestamp}.pdf")
+        # Only the PDF branch needs the frame (summary stats + charts)
+        df = _df_from_store(stored_data)
+        if df.empty:
+            return dbc.Alert("❌ Data expired, please fetch again before exporting", color="danger")
+        chart_iter = _iter_chart_images_for_export(df, ui_state, chart_types)
+        filepath = export_to_pdf(df, chart_iter, f"economic_report_{timestamp}.pdf")
         if filepath:
             return dbc.Alert(
-                [html.I(className="bi bi-check-circle me-2"), 
-                  f"✅ PDF exported successfully to: exports/pdf/{os.path.basename(filepath)}"],
+                [_ALERT_ICON, _PDF_MSG_TMPL.format(name=os.path.basename(filepath))],
                 color="success"
             )
         else:
@@ -756,43 +1345,48 @@ def handle_exports(csv_clicks, pdf_clicks, stored_data, chart_images_data):
      Output("data-store", "data", allow_duplicate=True),
      Output("imported-data-store", "data", allow_duplicate=True),
      Output("ui-state-store", "data", allow_duplicate=True),
-     Output("chart-images-store", "data", allow_duplicate=True),
      Output("charts-container", "children", allow_duplicate=True),
      Output("export-section", "style", allow_duplicate=True),
      Output("upload-status", "children", allow_duplicate=True),
-     Output("use-imported-btn", "disabled", allow_duplicate=True)], 
+     Output("use-imported-btn", "disabled", allow_duplicate=True)],
     Input("clear-all-btn", "n_clicks"),
+    [State("data-store", "data"),
+     State("imported-data-store", "data")],
     prevent_initial_call=True
 )
-def clear_all_data(n_clicks):
+def clear_all_data(n_clicks, stored_data, imported_data):
     """Resets all UI elements and stored data."""
     if n_clicks is None:
         return dash.no_update
-    
+
+    # A second click with nothing left to clear would still push nine
+    # default props and force a full client-side re-render; skip it. The
+    # session's own stores say whether it is already cleared.
+    if not stored_data and not imported_data:
+        return [dash.no_update] * 9
+
     default_indicators = ["GDP (Current US$)", "GDP Growth (Annual %)"]
     empty_data = {}
-    
+
     return (
-        [],                                 
-        default_indicators,                 
-        empty_data,                         
-        empty_data,                         
-        empty_data,                         
-        [],                                 
-        html.Div([]),                       
-        {"display": "none"},                
-        "",                                 
-        True                                
+        [],
+        default_indicators,
+        empty_data,
+        empty_data,
+        empty_data,
+        html.Div([]),
+        {"display": "none"},
+        "",
+        True
     )
 
 # Run the app
 if __name__ == "__main__":
-    if not os.path.exists('exports/csv'):
-        os.makedirs('exports/csv')
-    if not os.path.exists('exports/pdf'):
-        os.makedirs('exports/pdf')
-    
-    fetch_all_countries() 
+    # exist_ok handles the already-exists case in the same syscall
+    os.makedirs('exports/csv', exist_ok=True)
+    os.makedirs('exports/pdf', exist_ok=True)
+
+    fetch_all_countries()
     
     app.run_server(
         debug=SERVER_CONFIG.get('debug', True),